@@ -8,6 +8,7 @@ UI enhancements by Ed Barnard, Alan Buckley
 import asyncio
 import enum
 import logging
+import os
 import sys
 import traceback
 from pathlib import Path
@@ -17,8 +18,12 @@ from warnings import warn
 from qtpy import QtCore, QtWidgets, QtGui
 
 from ScopeFoundry import ini_io
-from ScopeFoundry.base_app.console_widget import new_console_widget
-from ScopeFoundry.base_app.logging_handlers import HtmlHandler
+from ScopeFoundry.base_app.console_widget import (
+    console_kernel_key,
+    new_console_widget,
+    prestart_in_process_kernel,
+)
+from ScopeFoundry.base_app.logging_handlers import HtmlHandler, RecordBufferHandler
 from ScopeFoundry.base_app.logging_widget import LoggingWidget
 from ScopeFoundry.dynamical_widgets.tree_widget import SubtreeManager
 from ScopeFoundry.helper_funcs import get_logger_from_class
@@ -57,6 +62,12 @@ class BaseApp(QtCore.QObject):
 
     name = "ScopeFoundry"
 
+    # pre-started (kernel_manager, kernel_client) for the console, see _prewarm_kernel
+    _kernel_pool: Dict[tuple, tuple] = {}
+
+    # resolved .ini path -> ((st_mtime_ns, st_size), settings), see load_ini_settings
+    _ini_cache: Dict[Path, tuple] = {}
+
     def __init__(self, argv: List[str] = [], **kwargs: Any) -> None:
         super().__init__()
 
@@ -68,7 +79,8 @@ class BaseApp(QtCore.QObject):
 
         self.setup_logging()
 
-        self.setup_console_widget()
+        # console is created on first access of self.console_widget
+        self._console_widget = None
 
         # containers to be filled
         self._subtree_managers_ = []
@@ -146,16 +158,50 @@ class BaseApp(QtCore.QObject):
     def setup(self) -> None:
         pass
 
+    @property
+    def console_widget(self) -> QtWidgets.QWidget:
+        """the console widget, created on first access"""
+        if self._console_widget is None:
+            self.setup_console_widget()
+        return self._console_widget
+
     def setup_console_widget(self, kernel: Any = None) -> QtWidgets.QWidget:
+        if self._console_widget is not None and kernel is None:
+            return self._console_widget
         try:
-            self.console_widget = new_console_widget(self, kernel)
+            in_process_kernel = None
+            if kernel is None:
+                in_process_kernel = self._kernel_pool.pop(console_kernel_key(), None)
+            self._console_widget = new_console_widget(self, kernel, in_process_kernel)
         except Exception as err:
             print(f"failed to setup console widget {err}")
-            self.console_widget = QtWidgets.QWidget()
-        self.console_widget.setWindowIcon(
+            self._console_widget = QtWidgets.QWidget()
+        self._console_widget.setWindowIcon(
             QtGui.QIcon(str(self.icons_path / "console_logo.png"))
         )
-        return self.console_widget
+        return self._console_widget
+
+    def _prewarm_kernel(self) -> None:
+        """
+        starts the console kernel ahead of time so that opening the console is instant.
+        schedule with QtCore.QTimer.singleShot(0, self._prewarm_kernel) once the ui is shown.
+        """
+        if self._console_widget is not None:
+            return
+        try:
+            key = console_kernel_key()
+            if key in self._kernel_pool:
+                return
+            in_process_kernel = prestart_in_process_kernel(self)
+        except Exception as err:
+            self.log.warning(f"failed to prewarm console kernel {err}")
+            return
+        if in_process_kernel is not None:
+            self._kernel_pool[key] = in_process_kernel
+
+    def show_console_widget(self) -> None:
+        self.console_widget.show()
+        self.console_widget.activateWindow()
 
     def setup_logging(self) -> None:
         self.log = get_logger_from_class(self)
@@ -167,13 +213,44 @@ class BaseApp(QtCore.QObject):
         logging.getLogger("LoggedQuantity").setLevel(logging.WARN)
         logging.getLogger("PyQt5").setLevel(logging.WARN)
 
-        self.logging_widget = LoggingWidget()
-        self.logging_widget.setWindowIcon(
+        # records are kept unformatted until the logging widget is created
+        self._logging_widget = None
+        self._log_buffer_handler = RecordBufferHandler(level=logging.DEBUG)
+        logging.getLogger().addHandler(self._log_buffer_handler)
+
+    @property
+    def logging_widget(self) -> LoggingWidget:
+        """the logging widget, created on first access"""
+        if self._logging_widget is None:
+            self.setup_logging_widget()
+        return self._logging_widget
+
+    def setup_logging_widget(self) -> LoggingWidget:
+        if self._logging_widget is not None:
+            return self._logging_widget
+        self._logging_widget = LoggingWidget()
+        self._logging_widget.setWindowIcon(
             QtGui.QIcon(str(self.icons_path / "log_logo.png"))
         )
         handler = HtmlHandler(level=logging.DEBUG)
-        handler.new_log_signal.connect(self.logging_widget.on_new_log)
-        logging.getLogger().addHandler(handler)
+        handler.new_log_signal.connect(self._logging_widget.on_new_log)
+
+        root_logger = logging.getLogger()
+        buffer_handler = self._log_buffer_handler
+        buffer_handler.acquire()  # records may be emitted from other threads
+        try:
+            records = list(buffer_handler.records)
+            buffer_handler.records.clear()
+            root_logger.addHandler(handler)
+            root_logger.removeHandler(buffer_handler)
+        finally:
+            buffer_handler.release()
+        self._logging_widget.add_logs([handler.format(r) for r in records])
+        return self._logging_widget
+
+    def show_logging_widget(self) -> None:
+        self.logging_widget.show()
+        self.logging_widget.activateWindow()
 
     def settings_save_ini_ask(self, dir: str = None, save_ro: bool = True) -> str:
         """Opens a Save dialogue asking the user to select a save destination and give the save file a filename. Saves settings to an .ini file."""
@@ -206,8 +283,10 @@ class BaseApp(QtCore.QObject):
     def add_lq_collection_to_settings_path(self, settings: LQCollection) -> None:
         settings.q_object.lq_added.connect(self.add_setting_path)
         settings.q_object.lq_removed.connect(self.remove_setting_path)
-        for lq in settings.as_dict().values():
-            self.add_setting_path(lq)
+        # the signal above handles LQs added later, register existing ones in one go
+        self._setting_paths.update(
+            {lq.path: lq for lq in settings.as_dict().values()}
+        )
 
     def write_setting(self, path: str, value: Any) -> WRITE_RES:
         lq = self.get_lq(path)
@@ -240,11 +319,12 @@ class BaseApp(QtCore.QObject):
         settings        dict       (path, value) map
         ==============  =========  ====================================================================================
         """
-        report = {}
-        for path, value in settings.items():
-            success = self.write_setting_safe(path, value)
-            report[path] = success
-        return report
+        # written in order with signals sent right away: e.g. hardware
+        # settings only reach the device once 'connected' has been written
+        return {
+            path: self.write_setting_safe(path, value)
+            for path, value in settings.items()
+        }
 
     def settings_save_ini(self, fname: str, save_ro: bool = True) -> None:
         """
@@ -255,6 +335,7 @@ class BaseApp(QtCore.QObject):
         """
         settings = self.read_settings(None, True)
         ini_io.save_settings(fname, settings)
+        self._ini_cache.pop(Path(fname).resolve(), None)
 
         if not save_ro:
             settings = {k: v for k, v in settings.items() if not self.get_lq(k).ro}
@@ -270,11 +351,31 @@ class BaseApp(QtCore.QObject):
         fname           str        relative path to the filename of the ini file.
         ==============  =========  ==============================================
         """
-        settings = ini_io.load_settings(fname)
+        settings = self.load_ini_settings(fname)
         self.write_settings_safe(settings)
         self.propose_settings_values(Path(fname).name, settings)
         return settings
 
+    def load_ini_settings(self, fname: str) -> Dict[str, Any]:
+        """
+        returns the (path, value) map of an .ini file. Parsed files are cached
+        and only re-read if their modification time or size changed.
+        """
+        path = Path(fname).resolve()
+        try:
+            st = os.stat(path)
+        except OSError:
+            # like ini_io.load_settings, unreadable files give no settings
+            self._ini_cache.pop(path, None)
+            return ini_io.load_settings(fname)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._ini_cache.get(path, None)
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+        settings = ini_io.load_settings(fname)
+        self._ini_cache[path] = (stamp, settings)
+        return dict(settings)
+
     def propose_settings_values(self, name: str, settings: Dict[str, Any]) -> None:
         """
         Adds to proposed_values of LQs.
@@ -303,8 +404,17 @@ class BaseApp(QtCore.QObject):
         paths              list[str]  paths to setting, if None(default) all paths are used
         ================== =========  =============================================================================
         """
-        paths = self._setting_paths if paths is None else paths
-        return {p: self.read_setting(p, ini_string_value) for p in paths}
+        if paths is None:
+            # no need to resolve the paths one by one
+            sp = self._setting_paths
+            if ini_string_value:
+                return {p: lq.ini_string_value() for p, lq in sp.items()}
+            return {p: lq.val for p, lq in sp.items()}
+
+        get_lq = self.get_lq
+        if ini_string_value:
+            return {p: get_lq(p).ini_string_value() for p in paths}
+        return {p: get_lq(p).val for p in paths}
 
     def read_setting(self, path: str, ini_string_value: bool = False) -> Any:
         lq = self.get_lq(path)
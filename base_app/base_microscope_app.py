@@ -153,6 +153,7 @@ class BaseMicroscopeApp(BaseApp):
 
         self.ui.show()
         self.ui.activateWindow()
+        QtCore.QTimer.singleShot(0, self._prewarm_kernel)
 
         confirm_on_close(
             widget=self.ui,
@@ -172,10 +173,7 @@ class BaseMicroscopeApp(BaseApp):
     def _setup_ui_buttons(self) -> None:
         # since v 1.6 no longer required if default .ui is used.
         if hasattr(self.ui, "console_pushButton"):
-            self.ui.console_pushButton.clicked.connect(self.console_widget.show)
-            self.ui.console_pushButton.clicked.connect(
-                self.console_widget.activateWindow
-            )
+            self.ui.console_pushButton.clicked.connect(self.show_console_widget)
         if hasattr(self.ui, "settings_autosave_pushButton"):
             self.ui.settings_autosave_pushButton.clicked.connect(
                 self.settings_auto_save_ini
@@ -257,10 +255,14 @@ class BaseMicroscopeApp(BaseApp):
                 partial(self.bring_mdi_subwin_to_front, subwin=self.logging_subwin)
             )
         else:
-            self.ui.action_console.triggered.connect(self.console_widget.show)
-            self.ui.action_log_viewer.triggered.connect(self.logging_widget.show)
-        self.ui.action_console.setIcon(self.console_widget.windowIcon())
-        self.ui.action_log_viewer.setIcon(self.logging_widget.windowIcon())
+            self.ui.action_console.triggered.connect(self.show_console_widget)
+            self.ui.action_log_viewer.triggered.connect(self.show_logging_widget)
+        self.ui.action_console.setIcon(
+            QtGui.QIcon(str(self.icons_path / "console_logo.png"))
+        )
+        self.ui.action_log_viewer.setIcon(
+            QtGui.QIcon(str(self.icons_path / "log_logo.png"))
+        )
         self.ui.action_propose_from_file.triggered.connect(
             self.settings.get_lq("propose_from_file").file_browser
         )
@@ -522,6 +524,7 @@ class BaseMicroscopeApp(BaseApp):
 
         settings = self.read_settings(paths, ini_string_value=True)
         ini_io.save_settings(fname, settings)
+        self._ini_cache.pop(Path(fname).resolve(), None)
 
         self.propose_settings_values(Path(fname).name, settings)
 
@@ -543,7 +546,7 @@ class BaseMicroscopeApp(BaseApp):
         fname           str        relative path to the filename of the ini file.
         ==============  =========  ==============================================
         """
-        settings = ini_io.load_settings(fname)
+        settings = self.load_ini_settings(fname)
 
         if ignore_hw_connect:
             settings = {
@@ -829,7 +832,7 @@ class BaseMicroscopeApp(BaseApp):
         if not path.exists() or path.suffix not in (".ini", ".h5"):
             return
         if path.suffix == ".ini":
-            settings = ini_io.load_settings(path)
+            settings = self.load_ini_settings(path)
         elif path.suffix == ".h5":
             settings = h5_io.load_settings(path)
         self.propose_settings_values(path.name, settings)
@@ -3,30 +3,85 @@ import logging
 import numpy as np
 import pyqtgraph as pg
 
-try:
-    import IPython
-
-    if (
-        IPython.version_info[0] < 4
-    ):  # compatibility for IPython < 4.0 (pre Jupyter split)
-        from IPython.qt.console.rich_ipython_widget import (
-            RichIPythonWidget as RichJupyterWidget,
+CONSOLE_TYPE = None
+
+BANNER = """
+                ScopeFoundry Console
+                
+                Variables:
+                    * np: numpy package
+                    * app: the ScopeFoundry App object
+                """
+
+
+def import_console_modules():
+    """
+    imports the console backend on first use (IPython/qtconsole are slow to import)
+    and returns the CONSOLE_TYPE.
+    """
+    global CONSOLE_TYPE, RichJupyterWidget, QtInProcessKernelManager, pyqtgraph
+    if CONSOLE_TYPE is not None:
+        return CONSOLE_TYPE
+    try:
+        import IPython
+
+        if (
+            IPython.version_info[0] < 4
+        ):  # compatibility for IPython < 4.0 (pre Jupyter split)
+            from IPython.qt.console.rich_ipython_widget import (
+                RichIPythonWidget as RichJupyterWidget,
+            )
+            from IPython.qt.inprocess import QtInProcessKernelManager
+        else:
+            from qtconsole.inprocess import QtInProcessKernelManager
+            from qtconsole.rich_jupyter_widget import RichJupyterWidget
+        CONSOLE_TYPE = "qtconsole"
+    except Exception as err:
+        logging.warning(
+            f"ScopeFoundry unable to import iPython console, using pyqtgraph.console instead. Error: {err}"
         )
-        from IPython.qt.inprocess import QtInProcessKernelManager
-    else:
-        from qtconsole.inprocess import QtInProcessKernelManager
-        from qtconsole.rich_jupyter_widget import RichJupyterWidget
-    CONSOLE_TYPE = "qtconsole"
-except Exception as err:
-    logging.warning(
-        f"ScopeFoundry unable to import iPython console, using pyqtgraph.console instead. Error: {err}"
-    )
-    import pyqtgraph.console
+        import pyqtgraph.console
+
+        CONSOLE_TYPE = "pyqtgraph.console"
+    return CONSOLE_TYPE
 
-    CONSOLE_TYPE = "pyqtgraph.console"
 
+def console_kernel_key():
+    """key under which a pre-started in-process kernel can be cached"""
+    return (import_console_modules(), BANNER)
 
-def new_console_widget(self, kernel=None):
+
+def start_in_process_kernel(app):
+    """starts an in-process kernel and returns (kernel_manager, kernel_client)"""
+    # https://github.com/ipython/ipython-in-depth/blob/master/examples/Embedding/inprocess_qtconsole.py
+    kernel_manager = QtInProcessKernelManager()
+    kernel_manager.start_kernel()
+    kernel = kernel_manager.kernel
+    kernel.shell.banner1 += BANNER
+    kernel.gui = "qt4"
+    kernel.shell.push({"np": np, "app": app})
+    kernel_client = kernel_manager.client()
+    kernel_client.start_channels()
+    return kernel_manager, kernel_client
+
+
+def prestart_in_process_kernel(app):
+    """
+    starts the in-process kernel that new_console_widget would create.
+    returns None if the console would not use an in-process kernel.
+    """
+    if import_console_modules() != "qtconsole":
+        return None
+    try:
+        import ipykernel
+
+        ipykernel.get_connection_file()
+        return None  # console connects to the already running kernel
+    except:
+        return start_in_process_kernel(app)
+
+
+def new_console_widget(self, kernel=None, in_process_kernel=None):
     """
     Create and return console QWidget. If Jupyter / IPython is installed
     this widget will be a full-featured IPython console. If Jupyter is unavailable
@@ -37,9 +92,13 @@ def new_console_widget(self, kernel=None):
 
     the returned console_widget will also be accessible as console_widget
 
+    *in_process_kernel* is an optional (kernel_manager, kernel_client) tuple
+    as returned by start_in_process_kernel, used instead of starting a new one
+
     In order to see the console widget, remember to insert it into an existing
     window or call console_widget.show() to create a new window
     """
+    import_console_modules()
     if CONSOLE_TYPE == "pyqtgraph.console":
         console_widget = pyqtgraph.console.ConsoleWidget(
             namespace={"app": self, "pg": pg, "np": np}, text="ScopeFoundry Console"
@@ -58,21 +117,11 @@ def new_console_widget(self, kernel=None):
                 console_widget = app.new_frontend_connection(conn_file)
                 console_widget.setWindowTitle("ScopeFoundry IPython Console")
             except:  # make your own new in-process kernel
-                # https://github.com/ipython/ipython-in-depth/blob/master/examples/Embedding/inprocess_qtconsole.py
-                kernel_manager = QtInProcessKernelManager()
-                kernel_manager.start_kernel()
-                kernel = kernel_manager.kernel
-                kernel.shell.banner1 += """
-                ScopeFoundry Console
-                
-                Variables:
-                    * np: numpy package
-                    * app: the ScopeFoundry App object
-                """
-                kernel.gui = "qt4"
-                kernel.shell.push({"np": np, "app": self})
-                kernel_client = kernel_manager.client()
-                kernel_client.start_channels()
+                if in_process_kernel is None:
+                    in_process_kernel = start_in_process_kernel(self)
+                else:
+                    in_process_kernel[0].kernel.shell.push({"np": np, "app": self})
+                kernel_manager, kernel_client = in_process_kernel
 
                 # console_widget = RichIPythonWidget()
                 console_widget = RichJupyterWidget()
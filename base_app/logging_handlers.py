@@ -1,5 +1,6 @@
 import logging
 import time
+from collections import deque
 from logging import Handler
 
 from qtpy import QtCore
@@ -40,6 +41,18 @@ class HtmlHandler(Handler):
         return f"""{timestamp} - <span style="{style}">{record.levelname}</span>: <i>{record.name}</i> :<pre>{record.msg}</pre><br>"""
 
 
+class RecordBufferHandler(Handler):
+    """keeps the last *buffer_len* records unformatted, cheap until they are needed"""
+
+    def __init__(self, level=logging.NOTSET, buffer_len=500):
+
+        Handler.__init__(self, level=level)
+        self.records = deque(maxlen=buffer_len)
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
 class StatusBarHandler(Handler):
 
     def __init__(self, level=logging.NOTSET, setter=print):
@@ -25,7 +25,10 @@ class LoggingWidget(QtWidgets.QWidget):
 
     @QtCore.Slot(str)
     def on_new_log(self, log_entry: str):
-        self.messages.append(log_entry)
+        self.add_logs([log_entry])
+
+    def add_logs(self, log_entries: list):
+        self.messages += log_entries
         if len(self.messages) > self.buffer_len:
             self.messages = ["...<br>"] + self.messages[-self.buffer_len :]
         self.text_edit.setHtml("\n".join(self.messages))
@@ -1,4 +1,4 @@
-import argparse
+import os
 from collections import OrderedDict
 from pathlib import Path
 
@@ -6,7 +6,7 @@ from qtpy import QtCore, QtWidgets, QtGui
 
 from ScopeFoundry import BaseApp, LoggedQuantity
 from ScopeFoundry.data_browser.data_browser_view import DataBrowserView
-from ScopeFoundry.dynamical_widgets.tree_widget import new_tree_widget
+from ScopeFoundry.dynamical_widgets.tree_widget import SubtreeManager, new_tree_widget
 from ScopeFoundry.helper_funcs import load_qt_ui_file, load_qt_ui_from_pkg, sibling_path
 from ScopeFoundry.data_browser.viewers.file_info import FileInfoView
 
@@ -20,6 +20,10 @@ class DataBrowser(BaseApp):
 
         self.views = OrderedDict()
         self.view_stack_indices = {}
+        # view name -> lower case suffixes, empty if view has to be probed for any file
+        self._view_suffixes = {}
+        # suffix -> names of views to probe in auto_select_view, last added first
+        self._suffix_to_views = {}
 
         self.plugin_update_funcs = []
         self.plugins = {}
@@ -61,16 +65,28 @@ class DataBrowser(BaseApp):
 
         self.setup()
 
-        # Does this even work?
-        parser = argparse.ArgumentParser()
-        for lq in self.settings.as_list():
-            parser.add_argument(f"--{lq.name}")
-        args = parser.parse_args()
-        for lq in self.settings.as_list():
-            if lq.name in args:
-                val = getattr(args, lq.name)
-                if val is not None:
-                    lq.update_value(val)
+        self.apply_cli_args(argv)
+
+        # build the settings dialog at idle time so that it opens instantly
+        QtCore.QTimer.singleShot(500, self._prebuild_trees_dialog)
+
+    def apply_cli_args(self, argv):
+        """
+        updates app settings given as command line arguments of the
+        form --name value or --name=value, unknown arguments are ignored.
+        """
+        args = argv[1:]
+        for i, arg in enumerate(args):
+            if not arg.startswith("--"):
+                continue
+            name, sep, val = arg[2:].partition("=")
+            if not sep:
+                if i + 1 == len(args) or args[i + 1].startswith("--"):
+                    continue
+                val = args[i + 1]
+            lq = self._setting_paths.get(f"app/{name}", None)
+            if lq is not None:
+                lq.update_value(val)
 
     def setup(self):
         """overite in child to add further views and plug_ins"""
@@ -87,6 +103,7 @@ class DataBrowser(BaseApp):
         # file system tree
         self.tree_view = self.ui.treeView
         self.fs_model = QtWidgets.QFileSystemModel()
+        self._last_filter_tokens = None
         self.fs_model.setRootPath(QtCore.QDir.currentPath())
         self.tree_view.setModel(self.fs_model)
         self.tree_view.setIconSize(QtCore.QSize(16, 16))
@@ -96,6 +113,14 @@ class DataBrowser(BaseApp):
         self.tree_selectionModel.selectionChanged.connect(
             self.on_treeview_selection_change
         )
+        # coalesces fast selection changes (e.g. holding an arrow key)
+        self._pending_fname = None
+        # (fname, is_file) from the file system model during a selection, saves a stat call
+        self._current_is_file = (None, False)
+        self._pending_is_file = False
+        self._sel_timer = QtCore.QTimer()
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.timeout.connect(self._apply_pending_selection)
 
         self.view_stack: QtWidgets.QStackedWidget = self.ui.views_stack_widget
 
@@ -107,22 +132,26 @@ class DataBrowser(BaseApp):
         s.browse_dir.connect_to_browse_widgets(
             self.ui.browse_dir_lineEdit, self.ui.browse_dir_browse_pushButton
         )
-        self.ui.data_filename_recycle_pushButton.clicked.connect(self.on_recycle)
-        self.ui.data_filename_rename_pushButton.clicked.connect(self.on_rename)
         s.view_name.connect_to_widget(self.ui.view_name_comboBox)
         s.auto_select_view.connect_to_widget(self.ui.auto_select_checkBox)
         s.file_filter.connect_to_widget(self.ui.file_filter_lineEdit)
 
-        self.ui.console_pushButton.clicked.connect(self.console_widget.show)
-        self.ui.log_pushButton.clicked.connect(self.logging_widget.show)
-
-        self.ui.action_save_as_ini.triggered.connect(self.settings_save_dialog)
-        self.ui.action_load_ini.triggered.connect(self.settings_load_dialog)
-        self.ui.action_show_settings.triggered.connect(self.on_show_settings)
-        self.ui.show_settings_pushButton.clicked.connect(self.on_show_settings)
+        # buttons and actions only emit from the gui thread: connect directly
+        for signal, slot in (
+            (self.ui.data_filename_recycle_pushButton.clicked, self.on_recycle),
+            (self.ui.data_filename_rename_pushButton.clicked, self.on_rename),
+            (self.ui.console_pushButton.clicked, self.show_console_widget),
+            (self.ui.log_pushButton.clicked, self.show_logging_widget),
+            (self.ui.action_save_as_ini.triggered, self.settings_save_dialog),
+            (self.ui.action_load_ini.triggered, self.settings_load_dialog),
+            (self.ui.action_show_settings.triggered, self.on_show_settings),
+            (self.ui.show_settings_pushButton.clicked, self.on_show_settings),
+        ):
+            signal.connect(slot, QtCore.Qt.DirectConnection)
 
         self.ui.show()
         self.ui.raise_()
+        QtCore.QTimer.singleShot(0, self._prewarm_kernel)
 
         self.ui.keyPressEvent = self.handle_key_board
 
@@ -148,6 +177,15 @@ class DataBrowser(BaseApp):
         # Update views dict
         self.views[new_view.name] = new_view
 
+        suffixes = new_view.supported_suffixes
+        if (
+            not suffixes
+            and type(new_view).is_file_supported is DataBrowserView.is_file_supported
+        ):
+            suffixes = (".h5",)  # default is_file_supported only handles .h5 files
+        self._view_suffixes[new_view.name] = tuple(x.lower() for x in suffixes)
+        self._suffix_to_views.clear()
+
         self.add_lq_collection_to_settings_path(new_view.settings)
 
         self.settings.get_lq("view_name").change_choice_list(list(self.views.keys()))
@@ -167,9 +205,16 @@ class DataBrowser(BaseApp):
         # deprecated use DataBrowser.add_view(new_view) instead
         self.add_view(new_view)
 
+    def is_data_file(self, fname):
+        """whether fname is a file, uses the tree selection info if fname was selected there"""
+        cached_fname, is_file = self._current_is_file
+        if cached_fname == fname:
+            return is_file
+        return Path(fname).is_file()
+
     def on_change_data_filename(self):
         fname = self.settings["data_filename"]
-        if not Path(fname).is_file():
+        if not self.is_data_file(fname):
             print("invalid data_filename", fname)
             return
 
@@ -192,8 +237,17 @@ class DataBrowser(BaseApp):
     @QtCore.Slot()
     def on_change_browse_dir(self):
         self.log.debug("on_change_browse_dir")
-        self.ui.treeView.setRootIndex(self.fs_model.index(self.settings["browse_dir"]))
-        self.fs_model.setRootPath(self.settings["browse_dir"])
+        new = str(self.settings["browse_dir"])
+        root = self.fs_model.rootPath()
+        if os.path.normcase(os.path.normpath(new)) == os.path.normcase(
+            os.path.normpath(root)
+        ):
+            # already watched, avoid re-scanning the directory
+            idx = self.fs_model.index(root)
+        else:
+            # setRootPath returns the index of the new root
+            idx = self.fs_model.setRootPath(new)
+        self.ui.treeView.setRootIndex(idx)
 
     def on_change_file_filter(self):
         self.log.debug("on_change_file_filter")
@@ -201,9 +255,12 @@ class DataBrowser(BaseApp):
         if filter_str == "":
             filter_str = "*"
             self.settings["file_filter"] = "*"
-        filter_str_list = [x.strip() for x in filter_str.split(",")]
-        self.log.debug(filter_str_list)
-        self.fs_model.setNameFilters(filter_str_list)
+        tokens = tuple(x.strip() for x in filter_str.split(",") if x.strip())
+        if tokens == self._last_filter_tokens:
+            return  # setNameFilters would re-scan the directory for nothing
+        self._last_filter_tokens = tokens
+        self.log.debug(tokens)
+        self.fs_model.setNameFilters(list(tokens))
 
     def setup_view(self, view: DataBrowserView):
 
@@ -217,24 +274,59 @@ class DataBrowser(BaseApp):
         self.view_stack.setCurrentIndex(self.view_stack_indices[view.name])
 
     def on_change_view_name(self):
-        self.current_view = self.views[self.settings["view_name"]]
+        view_name = self.settings["view_name"]
+        self.flush_pending_selection()
+        if self.settings["view_name"] != view_name:
+            # auto_select_view of the flushed selection must not override the user's choice
+            self.settings["view_name"] = view_name
+            return
+        self.current_view = self.views[view_name]
         self.setup_view(self.current_view)
 
         # udpate
         fname = self.settings["data_filename"]
-        if Path(fname).is_file():
+        if self.is_data_file(fname):
             self.current_view.on_change_data_filename(fname)
 
     def on_treeview_selection_change(self, sel, desel):
-        fname = self.fs_model.filePath(self.tree_selectionModel.currentIndex())
-        self.settings["data_filename"] = fname
+        index = self.tree_selectionModel.currentIndex()
+        fname = self.fs_model.filePath(index)
+        # only the last selection within 50 ms gets loaded
+        self._pending_fname = fname
+        # same as Path.is_file(): false for broken links, fifos, devices
+        self._pending_is_file = index.isValid() and self.fs_model.fileInfo(index).isFile()
+        self._sel_timer.start(50)
 
     #        print( 'on_treeview_selection_change' , fname, sel, desel)
 
+    def flush_pending_selection(self):
+        """applies a tree selection that is still waiting for the debounce timer"""
+        if self._sel_timer.isActive():
+            self._sel_timer.stop()
+            self._apply_pending_selection()
+
+    def _apply_pending_selection(self):
+        # the file system model info is only trusted while handling this selection
+        self._current_is_file = (self._pending_fname, self._pending_is_file)
+        try:
+            self.settings["data_filename"] = self._pending_fname
+        finally:
+            self._current_is_file = (None, False)
+
     def auto_select_view(self, fname):
         "return the name of the last supported view for the given fname"
-        for view_name, view in list(self.views.items())[::-1]:
-            if view.is_file_supported(fname):
+        suffix = Path(fname).suffix.lower()
+        view_names = self._suffix_to_views.get(suffix, None)
+        if view_names is None:
+            view_names = [
+                view_name
+                for view_name in reversed(self.views)
+                if not self._view_suffixes[view_name]
+                or suffix in self._view_suffixes[view_name]
+            ]
+            self._suffix_to_views[suffix] = view_names
+        for view_name in view_names:
+            if self.views[view_name].is_file_supported(fname):
                 return view_name
         return "file_info"
 
@@ -242,9 +334,11 @@ class DataBrowser(BaseApp):
         # import here because send2trash is not a built in library.
         import send2trash
 
+        self.flush_pending_selection()
         send2trash.send2trash(Path(self.settings["data_filename"]))
 
     def on_rename(self):
+        self.flush_pending_selection()
         fname = self.settings["data_filename"]
         dialog = RenameDialog(prev_path_name=fname)
         if not dialog.exec_():
@@ -266,21 +360,12 @@ class DataBrowser(BaseApp):
         where section are "view", "plugin" or "app"
         returns None if it does not exist
         """
-        parts = path.split("/")
-
-        settings = self.settings
-        if parts[0] == "view":
-            view = self.views.get(parts[1], None)
-            if view is not None:
-                self.load_view(view)
-                settings = view.settings
-        elif parts[0] == "plugin":
-            plugin = self.plugins.get(parts[1], None)
-            if plugin is not None:
-                settings = plugin.settings
-
-        if parts[-1] in settings:
-            return settings.get_lq(parts[-1])
+        # settings of views and plugins are registered in add_view and add_plugin
+        lq = self._setting_paths.get(path, None)
+        if lq is None and "/" not in path:
+            # bare name of an app setting
+            lq = self._setting_paths.get(f"app/{path}", None)
+        return lq
 
     def settings_save_dialog(self):
         """Opens a save as ini dialogue in the app user interface."""
@@ -300,37 +385,52 @@ class DataBrowser(BaseApp):
         # elif fname.endswith(".h5"):
         #     self.settings_load_h5(fname)
 
-    def on_show_settings(self):
-        if not hasattr(self, "_trees_dialog"):
-
-            app_tree = new_tree_widget((self,), ("app", ""))
-            views_tree = new_tree_widget(
-                [obj for obj in self.views.values()], ("views", "")
-            )
-            plugins_tree = new_tree_widget(
-                [obj for obj in self.plugins.values()], ("plugins", "")
-            )
-
-            splitter = QtWidgets.QSplitter()
-            splitter.addWidget(app_tree)
-            splitter.addWidget(views_tree)
-            splitter.addWidget(plugins_tree)
-
-            pb_hlayout = QtWidgets.QHBoxLayout()
-            pb = QtWidgets.QPushButton("save ini ...")
-            pb.clicked.connect(self.settings_save_ini_ask)
-            pb_hlayout.addWidget(pb)
-            pb = QtWidgets.QPushButton("load ini ...")
-            pb.clicked.connect(self.settings_load_ini_ask)
-            pb_hlayout.addWidget(pb)
-
-            layout = QtWidgets.QVBoxLayout()
-            layout.addWidget(splitter)
-            layout.addLayout(pb_hlayout)
-
-            self._trees_dialog = QtWidgets.QDialog()
-            self._trees_dialog.setLayout(layout)
+    def _prebuild_trees_dialog(self):
+        if hasattr(self, "_trees_dialog"):
+            self._add_missing_subtrees()
+            return
 
+        app_tree = new_tree_widget((self,), ("app", ""))
+        self._views_tree = new_tree_widget((), ("views", ""))
+        self._plugins_tree = new_tree_widget((), ("plugins", ""))
+        self._subtree_names = {"views": set(), "plugins": set()}
+        self._add_missing_subtrees()
+
+        splitter = QtWidgets.QSplitter()
+        splitter.addWidget(app_tree)
+        splitter.addWidget(self._views_tree)
+        splitter.addWidget(self._plugins_tree)
+
+        pb_hlayout = QtWidgets.QHBoxLayout()
+        pb = QtWidgets.QPushButton("save ini ...")
+        pb.clicked.connect(self.settings_save_ini_ask)
+        pb_hlayout.addWidget(pb)
+        pb = QtWidgets.QPushButton("load ini ...")
+        pb.clicked.connect(self.settings_load_ini_ask)
+        pb_hlayout.addWidget(pb)
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(splitter)
+        layout.addLayout(pb_hlayout)
+
+        self._trees_dialog = QtWidgets.QDialog()
+        self._trees_dialog.setLayout(layout)
+
+    def _add_missing_subtrees(self):
+        """adds views and plugins that were added after the trees were built"""
+        for key, tree, objs in (
+            ("views", self._views_tree, self.views),
+            ("plugins", self._plugins_tree, self.plugins),
+        ):
+            names = self._subtree_names[key]
+            for name, obj in objs.items():
+                if name not in names:
+                    SubtreeManager(tree, obj)
+                    names.add(name)
+
+    def on_show_settings(self):
+        # usually prebuilt at idle, only adds views or plugins added since
+        self._prebuild_trees_dialog()
         self._trees_dialog.exec_()
 
 
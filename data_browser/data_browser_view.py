@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Tuple
 
 from qtpy import QtCore
 
@@ -15,6 +15,10 @@ class DataBrowserView:
 
     name = "base_view"  # override me! (recommended to use the ScopeFoundry.Measurement.name)
 
+    # optional: file suffixes (e.g. ".npz") the view can handle. If not empty,
+    # is_file_supported is only called for files with one of these suffixes.
+    supported_suffixes: Tuple[str, ...] = ()
+
     def __init__(self, databrowser):
         self.databrowser = databrowser
         self.settings = LQCollection(path=f"view/{self.name}")
@@ -7,6 +7,7 @@ class NPZView(DataBrowserView):
     
     """
     name = 'npz_view'
+    supported_suffixes = (".npz",)
     
     def setup(self):
         
@@ -12,6 +12,7 @@ MEASURE_NAMES = ("auto_focus", "ranged_optimization")
 
 class RangedOptimizationH5View(DataBrowserView):
     name = "ranged_optimization_h5"
+    supported_suffixes = (".h5",)
 
     def is_file_supported(self, fname):
         # ADD other ranged optimization here
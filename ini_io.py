@@ -1,5 +1,7 @@
 """helpers for handling .ini files"""
 import configparser
+import io
+from pathlib import Path
 
 TRANSLATIONS = {"True": True, "False": False}
 REV_TRANSLATIONS = {v: k for k, v in TRANSLATIONS.items()}
@@ -31,13 +33,21 @@ def from_path_settings(settings):
 def laod_ini(fname):
     config = configparser.ConfigParser(interpolation=None)
     config.optionxform = str
-    config.read(fname)
+    try:
+        # read the whole file at once, locale encoding as ConfigParser.read
+        text = Path(fname).read_text()
+    except OSError:
+        pass  # like ConfigParser.read, unreadable files are ignored
+    else:
+        config.read_string(text, source=str(fname))
     return config
 
 
 def save_ini(ini_fname, config):
-    with open(ini_fname, "w") as file:
-        config.write(file)
+    # build the file in memory and write it with a single call
+    buffer = io.StringIO()
+    config.write(buffer)
+    Path(ini_fname).write_text(buffer.getvalue())
 
 
 def load_settings(ini_fname):
@@ -1,9 +1,10 @@
 from pathlib import Path
+import tempfile
 import unittest
 
 import numpy as np
 
-from ScopeFoundry import BaseMicroscopeApp, HardwareComponent, Measurement
+from ScopeFoundry import BaseMicroscopeApp, HardwareComponent, Measurement, ini_io
 from ScopeFoundry.base_app.base_app import WRITE_RES
 
 
@@ -27,6 +28,23 @@ class Hardware1(HardwareComponent):
         self.settings.New("protected_int", int, initial=0, protected=True)
 
 
+class Hardware2(HardwareComponent):
+    name = "hardware2"
+
+    def setup(self):
+        self.settings.New("wavelength", float, initial=0.0)
+        self.device = {}
+
+    def connect(self):
+        self.device = {"wavelength": -1.0}
+        self.settings.wavelength.connect_to_hardware(
+            write_func=lambda val: self.device.update(wavelength=val)
+        )
+
+    def disconnect(self):
+        self.settings.disconnect_all_from_hardware()
+
+
 INITIAL_CHOICES = [("choice 0", 0), ("choice 1", 1), ("choice 2", 2), ("choice 3", 3)]
 
 
@@ -135,6 +153,41 @@ class SettingsIOTest(unittest.TestCase):
         self.assertEqual(self.hws["float"], 0.0)
         self.assertEqual(self.hws["choices"], 0)
 
+    def test_hw_connected_before_hw_settings(self):
+        hw2 = self.app.add_hardware(Hardware2(self.app))
+        self.app.settings_load_ini(
+            self.root / "settings_io_test_hw_connect.ini", show_report=False
+        )
+        self.assertTrue(hw2.settings["connected"])
+        self.assertEqual(hw2.settings["wavelength"], 2.5)
+        # connect() ran before wavelength was written, so it reached the device
+        self.assertEqual(hw2.device["wavelength"], 2.5)
+        hw2.settings["connected"] = False
+
+    def test_load_ini_settings_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fname = Path(tmp_dir) / "cache_test.ini"
+            path = "mm/measure1/choices"
+
+            self.mms["choices"] = 1
+            self.app.settings_save_ini(fname)
+            self.assertEqual(self.app.load_ini_settings(fname)[path], "1")
+
+            # saving from the app drops the cached entry
+            self.mms["choices"] = 2
+            self.app.settings_save_ini(fname)
+            self.assertEqual(self.app.load_ini_settings(fname)[path], "2")
+
+            # rewritten by someone else
+            ini_io.save_settings(fname, {path: "3", "app/extra": "x"})
+            settings = self.app.load_ini_settings(fname)
+            self.assertEqual(settings[path], "3")
+            self.assertEqual(settings["app/extra"], "x")
+
+            # missing files give no settings
+            missing = Path(tmp_dir) / "missing.ini"
+            self.assertDictEqual(self.app.load_ini_settings(missing), {})
+
 
 if __name__ == "__main__":
     unittest.main()